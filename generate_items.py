@@ -1,542 +1,890 @@
-#!/usr/bin/env python3
-# -*- coding: utf-8 -*-
-"""
-Fantasy Item Catalog Generator (refactored, config-driven)
-- Produces a single pretty JSON with 1000+ items (default 5×200).
-- Strict name↔type consistency:
-    * Weapons: name core (e.g., "Axe", "Claymore") drives weapon_type.
-    * Armor: full suit only (armor_type="suit"), names include suit nouns (Armor/Mail/Plate Armor/...).
-    * Accessories: name core drives accessory_type.
-- Consumables follow your exact 'effect' schema; consumable_type stays "potion".
-- Image paths: res://assets/textures/<category>/<id>.png
-- Deterministic with RNG_SEED; configurable via CLI.
-
-Usage:
-    python3 generate_items.py
-    python3 generate_items.py --out assets/data/items.json --count 200 --seed 424242
-"""
-
-from __future__ import annotations
-import argparse
-import json
-import os
-import random
-import re
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Callable, Any
-from collections import OrderedDict as OD
-
-# =============================================================================
-# Configuration (tweak here)
-# =============================================================================
-
-RNG_SEED = 424242
-DEFAULT_OUTPUT_PATH = os.path.join("assets", "data", "items.json")
-DEFAULT_PER_CATEGORY = 200  # 5×200 = 1000 items
-
-RARITY_ORDER = ["common", "uncommon", "rare", "epic", "legendary"]
-RARITY_MULT: Dict[str, float] = {
-    "common": 1.0,
-    "uncommon": 1.5,
-    "rare": 2.5,
-    "epic": 4.0,
-    "legendary": 6.5,
-}
-RARITY_COLORS: Dict[str, str] = {
-    "common": "#FFFFFF",
-    "uncommon": "#00FF00",
-    "rare": "#0080FF",
-    "epic": "#8000FF",
-    "legendary": "#FF8000",
-}
-
-# Shop routing per category & rarity
-SHOPS_ALL = ["blacksmith", "general_store", "magic_shop", "alchemist", "rare_goods", "hunters_guild", "dungeon_merchant"]
-
-def shops_for(category: str, rarity: str) -> List[str]:
-    if category == "weapon":
-        return ["blacksmith", "general_store"] if rarity in ("common", "uncommon") else ["blacksmith", "rare_goods"]
-    if category == "armor":
-        return ["general_store", "blacksmith"] if rarity in ("common", "uncommon") else ["blacksmith", "rare_goods"]
-    if category == "accessory":
-        return ["general_store", "magic_shop"] if rarity in ("common", "uncommon") else ["magic_shop", "rare_goods"]
-    if category == "consumable":
-        return ["general_store", "alchemist"] if rarity in ("common", "uncommon") else ["alchemist", "rare_goods"]
-    return ["general_store"]
-
-# ---- Name pools ----
-PFX_COMMON = [
-    "Iron","Steel","Shadow","Storm","Ember","Frost","Moon","Sun","Dragon",
-    "Raven","Phoenix","Crystal","Obsidian","Silver","Golden","Void","Arcane",
-    "Whisper","Glacier","Oak","Sunsteel"
-]
-SUFFIX_FLAVOR = [
-    " of Dawn"," of Dusk"," of Whispers"," of the Phoenix"," of the Glacier"," of Storms",
-    " of Shadows"," of Radiance"," of Embers"," of Frost"," of the Dragon"," of the Raven",
-    " of Clarity"," of Might"," of Swiftness"," of Focus"," of the Tide"," of Sparks"
-]
-
-# Weapons: map name cores to weapon_type; use this for generation + validation
-WEAPON_NAME_CORES: List[Tuple[str, str]] = [
-    ("Sword", "sword"), ("Blade", "sword"), ("Saber", "sword"), ("Cutlass", "sword"), ("Claymore", "sword"),
-    ("Axe", "axe"), ("Waraxe", "axe"),
-    ("Mace", "mace"), ("Hammer", "mace"), ("Maul", "mace"),
-    ("Dagger", "dagger"), ("Dirk", "dagger"),
-    ("Spear", "spear"),
-    ("Halberd", "polearm"), ("Glaive", "polearm"),
-    ("Lance", "lance"),
-    ("Bow", "bow"), ("Crossbow", "crossbow"),
-    ("Staff", "staff"),
-    ("Scythe", "scythe"),
-]
-TYPE_TO_WEAPON_TOKENS: Dict[str, List[str]] = {
-    "sword": ["sword","blade","saber","cutlass","claymore"],
-    "axe": ["axe","waraxe"],
-    "mace": ["mace","hammer","maul"],
-    "dagger": ["dagger","dirk"],
-    "spear": ["spear"],
-    "lance": ["lance"],
-    "polearm": ["halberd","glaive"],
-    "bow": ["bow"],
-    "crossbow": ["crossbow"],
-    "staff": ["staff"],
-    "scythe": ["scythe"],
-}
-WEAPON_TOKENS_FLAT = sorted({t for lst in TYPE_TO_WEAPON_TOKENS.values() for t in lst})
-
-# Armor (suit-only): name cores; validate with tokens
-ARMOR_CORES = [
-    "Armor","Mail","Plate Armor","Scale Armor","Brigandine",
-    "Leather Armor","Chainmail Armor","Dragonscale Armor","Battle Armor","War Armor"
-]
-ARMOR_TOKENS = [t.lower() for t in ["armor","mail","brigandine","dragonscale","war armor","plate armor","scale armor","chainmail"]]
-
-# Accessories: map name cores to accessory_type
-ACCESSORY_NAME_CORES: List[Tuple[str, str]] = [
-    ("Ring", "ring"), ("Amulet", "amulet"), ("Charm", "charm"), ("Band", "band"),
-    ("Brooch", "brooch"), ("Talisman", "talisman"), ("Circlet", "circlet"),
-    ("Pendant", "pendant"), ("Bracelet", "bracelet"), ("Anklet", "anklet"), ("Sash", "sash")
-]
-
-# Consumables: base names + effect kind (consumable_type remains "potion" per your template)
-CONSUMABLE_TEMPLATES: List[Tuple[str, str]] = [
-    ("Health Potion", "heal"),
-    ("Greater Health Potion", "heal"),
-    ("Mana Potion", "mana_restore"),
-    ("Elixir of Strength", "stat_boost"),
-    ("Elixir of Dexterity", "stat_boost"),
-    ("Elixir of Constitution", "stat_boost"),
-    ("Elixir of Intelligence", "stat_boost"),
-    ("Elixir of Wisdom", "stat_boost"),
-    ("Elixir of Charisma", "stat_boost"),
-    ("Potion of Swiftness", "speed_boost"),
-]
-
-# Materials
-MATERIAL_TYPES = ["metal","wood","gem","stone","cloth","herb","essence","bone","leather"]
-MATERIAL_CORES = [
-    "Ingot","Bar","Ore","Shard","Crystal","Gem","Thread","Fiber","Silk","Heartwood","Wood","Plank",
-    "Pelt","Leather","Feather","Bone","Scale","Powder","Resin","Herb","Blossom","Root","Seed","Essence","Core"
-]
-
-# Crafting materials pool (IDs)
-CRAFT_POOL = [
-    "iron_ingot","steel_ingot","leather_strip","oak_wood","obsidian_shard","ember_crystal",
-    "arcane_thread","moonshade_fabric","vitality_herb","frost_core","storm_essence",
-    "sunsteel_ingot","drakescale","pure_water","healing_herb","luminescent_moss",
-    "crystal_shard","runed_stone","ghost_essence","phoenix_feather"
-]
-
-# Effects pool
-SPECIAL_EFFECT_POOL = [
-    "bleed_on_hit", "burn_on_hit", "freeze_on_hit", "shock_on_hit",
-    "mana_leech", "life_leech", "backstab_bonus", "parry_window",
-    "elemental_affinity:fire", "elemental_affinity:ice", "elemental_affinity:lightning",
-    "clarity:spell_focus", "frost_aura", "fear_aura", "thorns", "regen_over_time",
-    "dash_cooldown_reduction", "crit_chain", "lightning_chain"
-]
-
-ELEMENTS = ["fire","ice","lightning","poison"]
-
-# =============================================================================
-# Helpers (pure functions)
-# =============================================================================
-
-def to_id(name: str) -> str:
-    s = name.strip().lower().replace("'", "")
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    s = re.sub(r"_+", "_", s).strip("_")
-    return s
-
-_used_names: set[str] = set()
-def unique_name(base: str, allow_suffix: bool = True, allow_flavor: bool = True) -> str:
-    name = base
-    if allow_flavor and allow_suffix and random.random() < 0.5:
-        name += random.choice(SUFFIX_FLAVOR)
-    tries, n = 0, name
-    while n in _used_names and tries < 20:
-        tries += 1
-        n = f"{base} {random.randint(0, 999)}"
-    _used_names.add(n)
-    return n
-
-def img_path(category: str, _id: str) -> str:
-    return f"res://assets/textures/{category}/{_id}.png"
-
-def pick_rarity() -> str:
-    r = random.random()
-    if r < 0.45: return "common"
-    if r < 0.75: return "uncommon"
-    if r < 0.92: return "rare"
-    if r < 0.985: return "epic"
-    return "legendary"
-
-def level_for_rarity(r: str) -> int:
-    return {"common": random.randint(1,4), "uncommon": random.randint(5,8),
-            "rare": random.randint(9,12), "epic": random.randint(13,17),
-            "legendary": random.randint(18,20)}[r]
-
-def stat_bonus(r: str) -> int:
-    return int(round(RARITY_MULT[r]))
-
-def maybe_bonus(r: str) -> int:
-    return stat_bonus(r) if random.random() < 0.5 else 0
-
-def crit_chance(r: str) -> int:
-    return {"common": random.randint(3,4), "uncommon": random.randint(5,7),
-            "rare": random.randint(8,10), "epic": random.randint(10,12),
-            "legendary": random.randint(12,15)}[r]
-
-def crit_damage(r: str) -> int:
-    return 120 + int(round(10 * RARITY_MULT[r]))
-
-def maybe_effects(r: str) -> List[str]:
-    effects: List[str] = []
-    if random.random() < 0.33 or r in ("rare","epic","legendary"):
-        count = 1 + (1 if r in ("epic","legendary") else 0)
-        for _ in range(count):
-            e = random.choice(SPECIAL_EFFECT_POOL)
-            if e.startswith("elemental_affinity"):
-                e = f"{e}:{5 + int(5 * RARITY_MULT[r])}%"
-            elif e in ("bleed_on_hit","burn_on_hit","freeze_on_hit","shock_on_hit"):
-                e = f"{e}:{10 + int(5 * RARITY_MULT[r])}%:{random.randint(3,6)}s"
-            elif e == "clarity:spell_focus":
-                e = f"clarity:spell_focus:{5 + int(5 * RARITY_MULT[r])}%"
-            effects.append(e)
-    return effects
-
-def gold_value(r: str, min_v: int, max_v: int) -> int:
-    idx = RARITY_ORDER.index(r)
-    t = idx / (len(RARITY_ORDER)-1)
-    base = min_v + (max_v - min_v) * t
-    return int(base + random.randint(0, min_v))
-
-def craft_mats(r: str, min_n: int, max_n: int, *, liquid: bool=False) -> Dict[str, int]:
-    mats: Dict[str, int] = {}
-    for _ in range(random.randint(min_n, max_n)):
-        mat = random.choice(CRAFT_POOL)
-        if liquid and mat != "pure_water" and random.random() < 0.33:
-            mat = "pure_water"
-        mats[to_id(mat)] = 1 + (RARITY_ORDER.index(r) // 2)
-    return mats
-
-def elem_res(r: str) -> int:
-    if r == "common": return 0
-    if r == "uncommon": return random.choice([0,5])
-    if r == "rare": return random.choice([5,10,15])
-    if r == "epic": return random.choice([10,15,20])
-    return random.choice([15,20,25])
-
-def consumable_desc(kind: str, r: str) -> str:
-    return {
-        "heal": "Restores a modest amount of health instantly." if r=="common" else
-                "A potent brew that restores more health." if r=="uncommon" else
-                "A strong restorative for grievous wounds." if r=="rare" else
-                "An elite draught favored by champions." if r=="epic" else
-                "A mythical concoction that mends any injury.",
-        "mana_restore": "Replenishes a portion of mana instantly.",
-        "stat_boost": "Temporarily enhances attributes.",
-        "speed_boost": "Increases movement speed for a short time.",
-    }[kind]
-
-def build_effect(kind: str, r: str) -> Dict[str, Any]:
-    eff = OD([
-        ("type", kind), ("value", 0), ("duration", 0), ("instant", True),
-        ("stats_affected", OD([
-            ("health", 0), ("mana", 0),
-            ("strength", 0), ("dexterity", 0), ("constitution", 0),
-            ("intelligence", 0), ("wisdom", 0), ("charisma", 0),
-        ]))
-    ])
-    if kind == "heal":
-        v = 120 if r=="common" else 350 if r=="uncommon" else 600 if r=="rare" else 900 if r=="epic" else 1400
-        eff["value"] = v; eff["stats_affected"]["health"] = v
-    elif kind == "mana_restore":
-        v = 100 if r=="common" else 200 if r=="uncommon" else 350 if r=="rare" else 500 if r=="epic" else 750
-        eff["value"] = v; eff["stats_affected"]["mana"] = v
-    elif kind == "stat_boost":
-        dur = 300 if r in ("uncommon","common") else 600 if r=="rare" else 900 if r=="epic" else 1200
-        amt = 1 if r=="common" else 2 if r=="uncommon" else 3 if r=="rare" else 4 if r=="epic" else 5
-        which = random.choice(["strength","dexterity","constitution","intelligence","wisdom","charisma"])
-        eff["duration"] = dur; eff["instant"] = False
-        eff["stats_affected"][which] = amt
-    elif kind == "speed_boost":
-        eff["duration"] = 180 if r in ("common","uncommon") else 300 if r=="rare" else 420
-        eff["instant"] = False
-        eff["value"] = 15 if r=="common" else 20 if r=="uncommon" else 25 if r=="rare" else 30 if r=="epic" else 35
-    return eff
-
-# =============================================================================
-# Builders (category-specific)
-# =============================================================================
-
-# -- Weapons --
-def name_weapon() -> Tuple[str, str]:
-    core, wtype = random.choice(WEAPON_NAME_CORES)
-    base = f"{random.choice(PFX_COMMON)} {core}"
-    name = unique_name(base, allow_suffix=True, allow_flavor=True)
-    return name, wtype  # wtype derived from core
-
-def weapon_item() -> Dict[str, Any]:
-    r = pick_rarity()
-    name, wtype_from_core = name_weapon()
-    _id = to_id(name)
-    base_atk = random.randint(10, 20)
-    atk = int(round(base_atk * RARITY_MULT[r])) + random.randint(0, 3)
-    item = OD([
-        ("id", _id), ("name", name), ("type", "weapon"),
-        ("weapon_type", wtype_from_core),
-        ("rarity", r), ("level_requirement", level_for_rarity(r)),
-        ("stats", OD([
-            ("attack", atk),
-            ("strength_bonus", stat_bonus(r)), ("dexterity_bonus", stat_bonus(r)),
-            ("constitution_bonus", maybe_bonus(r)),
-            ("intelligence_bonus", 0), ("wisdom_bonus", 0), ("charisma_bonus", 0),
-            ("critical_chance", crit_chance(r)), ("critical_damage", crit_damage(r)),
-        ])),
-        ("special_effects", maybe_effects(r)),
-        ("value", gold_value(r, 100, 900)),
-        ("durability", random.randint(70,180)),
-        ("crafting", OD([
-            ("recipe_id", f"rcp_{_id}"),
-            ("materials", craft_mats(r, 2, 4)),
-        ])),
-        ("shop_availability", shops_for("weapon", r)),
-        ("image", img_path("weapons", _id)),
-    ])
-    # Validation
-    low = name.lower()
-    assert any(tok in low for tok in WEAPON_TOKENS_FLAT), f"Weapon name missing core: {name}"
-    assert any(tok in low for tok in TYPE_TO_WEAPON_TOKENS.get(item['weapon_type'], [])), f"Weapon name/type mismatch: {name} vs {item['weapon_type']}"
-    return item
-
-# -- Armor (suit only) --
-def name_armor() -> str:
-    base = f"{random.choice(PFX_COMMON)} {random.choice(ARMOR_CORES)}"
-    return unique_name(base, allow_suffix=True, allow_flavor=True)
-
-def armor_item() -> Dict[str, Any]:
-    r = pick_rarity()
-    name = name_armor()
-    # defensive retry to ensure tokens present
-    tries = 0
-    while not any(tok in name.lower() for tok in ARMOR_TOKENS) and tries < 5:
-        name = name_armor(); tries += 1
-    _id = to_id(name)
-    base_def = random.randint(12, 20)  # suits are beefier
-    defense = int(round(base_def * RARITY_MULT[r])) + random.randint(0, 3)
-    res = {e: elem_res(r) for e in ELEMENTS}
-    item = OD([
-        ("id", _id), ("name", name), ("type", "armor"),
-        ("armor_type", "suit"),
-        ("rarity", r), ("level_requirement", level_for_rarity(r)),
-        ("stats", OD([
-            ("defense", defense),
-            ("armor_class_bonus", min(int(RARITY_MULT[r]), 3)),
-            ("strength_bonus", maybe_bonus(r)),
-            ("dexterity_bonus", maybe_bonus(r)),
-            ("constitution_bonus", maybe_bonus(r)),
-            ("intelligence_bonus", 0), ("wisdom_bonus", 0), ("charisma_bonus", 0),
-            ("elemental_resistance", res),
-        ])),
-        ("special_effects", maybe_effects(r)),
-        ("value", gold_value(r, 120, 1800)),
-        ("durability", random.randint(110,190)),
-        ("crafting", OD([
-            ("recipe_id", f"rcp_{_id}"),
-            ("materials", craft_mats(r, 3, 5)),
-        ])),
-        ("shop_availability", shops_for("armor", r)),
-        ("image", img_path("armor", _id)),
-    ])
-    assert any(tok in name.lower() for tok in ARMOR_TOKENS), f"Armor name not a suit: {name}"
-    return item
-
-# -- Accessories (name core drives accessory_type) --
-def name_accessory() -> Tuple[str, str]:
-    core, atype = random.choice(ACCESSORY_NAME_CORES)
-    base = f"{random.choice(PFX_COMMON)} {core}"
-    name = unique_name(base, allow_suffix=True, allow_flavor=True)
-    return name, atype
-
-def accessory_item() -> Dict[str, Any]:
-    r = pick_rarity()
-    name, atype = name_accessory()
-    _id = to_id(name)
-    item = OD([
-        ("id", _id), ("name", name), ("type", "accessory"),
-        ("accessory_type", atype),
-        ("rarity", r), ("level_requirement", level_for_rarity(r)),
-        ("stats", OD([
-            ("strength_bonus", maybe_bonus(r)),
-            ("dexterity_bonus", maybe_bonus(r)),
-            ("constitution_bonus", maybe_bonus(r)),
-            ("intelligence_bonus", maybe_bonus(r)),
-            ("wisdom_bonus", maybe_bonus(r)),
-            ("charisma_bonus", maybe_bonus(r)),
-            ("mana_regeneration", int(round(RARITY_MULT[r]))),
-            ("health_regeneration", max(int(round(RARITY_MULT[r])) - 1, 0)),
-            ("experience_bonus", int(5 * RARITY_MULT[r]) if r in ("rare","epic","legendary") else 0),
-        ])),
-        ("special_effects", maybe_effects(r)),
-        ("value", gold_value(r, 150, 1800)),
-        ("durability", random.randint(40,120)),
-        ("crafting", OD([
-            ("recipe_id", f"rcp_{_id}"),
-            ("materials", craft_mats(r, 2, 3)),
-        ])),
-        ("shop_availability", shops_for("accessory", r)),
-        ("image", img_path("accessories", _id)),
-    ])
-    assert atype in name.lower(), f"Accessory name/type mismatch: {name} vs {atype}"
-    return item
-
-# -- Consumables (exact effect schema; type=potion) --
-def name_consumable() -> Tuple[str, str]:
-    base, kind = random.choice(CONSUMABLE_TEMPLATES)
-    name = unique_name(base, allow_suffix=False, allow_flavor=False)
-    return name, kind
-
-def consumable_item() -> Dict[str, Any]:
-    r = pick_rarity()
-    name, kind = name_consumable()
-    _id = to_id(name)
-    eff = build_effect(kind, r)
-    item = OD([
-        ("id", _id), ("name", name), ("type", "consumable"),
-        ("consumable_type", "potion"),
-        ("rarity", r), ("effect", eff),
-        ("stack_size", 99 if r in ("common","uncommon") else 10),
-        ("value", gold_value(r, 20, 400)),
-        ("crafting", OD([
-            ("recipe_id", f"rcp_{_id}"),
-            ("materials", craft_mats(r, 2, 3, liquid=True)),
-        ])),
-        ("shop_availability", shops_for("consumable", r)),
-        ("description", consumable_desc(kind, r)),
-        ("image", img_path("consumables", _id)),
-    ])
-    # Basic validation: must mention potion/elixir/etc. in name
-    low = name.lower()
-    assert any(k in low for k in ["potion","elixir","draught","scroll","tonic"]), f"Consumable name missing keyword: {name}"
-    return item
-
-# -- Materials --
-def name_material() -> str:
-    base = f"{random.choice(PFX_COMMON)} {random.choice(MATERIAL_CORES)}"
-    return unique_name(base, allow_suffix=False, allow_flavor=False)
-
-def material_item() -> Dict[str, Any]:
-    r = random.choices(RARITY_ORDER, weights=[45,30,18,6,1])[0]
-    name = name_material()
-    _id = to_id(name)
-    mtype = random.choice(MATERIAL_TYPES)
-    territory_pool = ["verdant_lands_mines","forest_logging_camps","tannery","crystal_cavern","ashmire_deep","ember_hollows"]
-    dungeons = ["ember_hollows","ashmire_deep","moonlit_keep","glacier_pass"]
-    sources: List[Dict[str, Any]] = [
-        OD([("type","territory_income"),("source_id",random.choice(territory_pool)),("rate_per_hour",round(random.uniform(1.5,4.5),2)),("drop_rate",0.0)]),
-        OD([("type","shop"),("source_id",random.choice(["blacksmith","general_store","alchemist","rare_goods"])),("rate_per_hour",0.0),("drop_rate",0.0)]),
-    ]
-    if random.random() < 0.33:
-        sources.append(OD([("type","dungeon_drop"),("source_id",random.choice(dungeons)),("rate_per_hour",0.0),("drop_rate",round(random.uniform(5.0,18.0),2))]))
-    item = OD([
-        ("id", _id), ("name", name), ("type", "crafting_material"),
-        ("material_type", mtype),
-        ("rarity", r), ("stack_size", 999), ("value", gold_value(r, 3, 45)),
-        ("sources", sources),
-        ("description", random.choice([
-            "A bar of smelted stock, sturdy and ubiquitous.",
-            "Highly sought for advanced recipes.",
-            "Flickers with latent energy.",
-            "Seasoned resource prized by artisans.",
-            "Conductive material suited for runework."
-        ])),
-        ("image", img_path("materials", _id)),
-    ])
-    # Validation: ensure material-esque token appears
-    low = name.lower()
-    assert any(tok in low for tok in ["ingot","bar","ore","shard","crystal","gem","thread","fiber","silk","heartwood","wood","plank","pelt","leather","feather","bone","scale","powder","resin","herb","blossom","root","seed","essence","core"]), f"Material name lacks material token: {name}"
-    return item
-
-# =============================================================================
-# Orchestration
-# =============================================================================
-
-BUILDERS: Dict[str, Callable[[], Dict[str, Any]]] = {
-    "weapons": weapon_item,
-    "armor": armor_item,
-    "accessories": accessory_item,
-    "consumables": consumable_item,
-    "materials": material_item,
-}
-
-@dataclass
-class GenConfig:
-    per_category: int = DEFAULT_PER_CATEGORY
-    out_path: str = DEFAULT_OUTPUT_PATH
-    seed: int = RNG_SEED
-
-def generate(cfg: GenConfig) -> Dict[str, Any]:
-    random.seed(cfg.seed)
-    os.makedirs(os.path.dirname(cfg.out_path), exist_ok=True)
-
-    data = OD([
-        ("version", "1.0"),
-        ("categories", OD([
-            ("weapons", [BUILDERS["weapons"]() for _ in range(cfg.per_category)]),
-            ("armor", [BUILDERS["armor"]() for _ in range(cfg.per_category)]),
-            ("accessories", [BUILDERS["accessories"]() for _ in range(cfg.per_category)]),
-            ("consumables", [BUILDERS["consumables"]() for _ in range(cfg.per_category)]),
-            ("materials", [BUILDERS["materials"]() for _ in range(cfg.per_category)]),
-            ("rarity_multipliers", RARITY_MULT),
-            ("rarity_colors", RARITY_COLORS),
-        ]))
-    ])
-    return data
-
-def write_json(path: str, obj: Dict[str, Any]) -> None:
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(obj, f, ensure_ascii=False, indent=2)
-        f.write("\n")
-
-# =============================================================================
-# CLI
-# =============================================================================
-
-def parse_args() -> GenConfig:
-    ap = argparse.ArgumentParser(description="Generate a Godot-ready item catalog JSON.")
-    ap.add_argument("--out", dest="out_path", default=DEFAULT_OUTPUT_PATH, help="Output JSON path")
-    ap.add_argument("--count", dest="count", type=int, default=DEFAULT_PER_CATEGORY, help="Items per category")
-    ap.add_argument("--seed", dest="seed", type=int, default=RNG_SEED, help="Random seed")
-    args = ap.parse_args()
-    return GenConfig(per_category=args.count, out_path=args.out_path, seed=args.seed)
-
-def main() -> None:
-    cfg = parse_args()
-    data = generate(cfg)
-    write_json(cfg.out_path, data)
-    total = cfg.per_category * 5
-    print(f"✅ Wrote {cfg.out_path} with {total} items (armor = full suits).")
-
-if __name__ == "__main__":
-    main()
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Fantasy Item Catalog Generator (refactored, config-driven)
+- Produces a single pretty JSON with 1000+ items (default 5×200).
+- Strict name↔type consistency:
+    * Weapons: name core (e.g., "Axe", "Claymore") drives weapon_type.
+    * Armor: full suit only (armor_type="suit"), names include suit nouns (Armor/Mail/Plate Armor/...).
+    * Accessories: name core drives accessory_type.
+- Consumables follow your exact 'effect' schema; consumable_type stays "potion".
+- Image paths: res://assets/textures/<category>/<id>.png
+- Deterministic with RNG_SEED; configurable via CLI.
+
+Usage:
+    python3 generate_items.py
+    python3 generate_items.py --out assets/data/items.json --count 200 --seed 424242
+    python3 generate_items.py --validate   # also check every name against its category tokens
+    python3 generate_items.py --count 20000 --jobs 5   # build the five categories in parallel
+    pypy3 generate_items.py --count 20000              # may be faster for big runs (pure-Python hot loop)
+
+The generator is pure stdlib Python, so it runs unchanged under PyPy, whose JIT
+may speed up its arithmetic/dict-building loop (not benchmarked). orjson is CPython-only; under PyPy the
+stdlib json fallback is used automatically.
+"""
+
+from __future__ import annotations
+import argparse
+import json
+import os
+import random
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Callable, Any, Iterable, Iterator
+
+try:  # optional: C-level pretty encoder, several times faster than json's indent path
+    import orjson
+except ImportError:
+    orjson = None
+
+# =============================================================================
+# Configuration (tweak here)
+# =============================================================================
+
+RNG_SEED = 424242
+DEFAULT_OUTPUT_PATH = os.path.join("assets", "data", "items.json")
+DEFAULT_PER_CATEGORY = 200  # 5×200 = 1000 items
+VALIDATE = False            # check every item's name/type (enable with --validate; skipped under python -O)
+VALIDATE_SAMPLE = 25        # leading items per category checked even without --validate
+
+RARITY_ORDER = ["common", "uncommon", "rare", "epic", "legendary"]
+RARITY_IDX: Dict[str, int] = {r: i for i, r in enumerate(RARITY_ORDER)}  # rarity name -> rarity code
+RARITY_MULT: Dict[str, float] = {
+    "common": 1.0,
+    "uncommon": 1.5,
+    "rare": 2.5,
+    "epic": 4.0,
+    "legendary": 6.5,
+}
+RARITY_COLORS: Dict[str, str] = {
+    "common": "#FFFFFF",
+    "uncommon": "#00FF00",
+    "rare": "#0080FF",
+    "epic": "#8000FF",
+    "legendary": "#FF8000",
+}
+
+# Cumulative rarity odds, drawn in one batch per category (45/30/17/6.5/1.5 %).
+# Materials use their own, slightly flatter curve (45/30/18/6/1 %).
+RARITY_CUM_WEIGHTS: Tuple[float, ...] = (0.45, 0.75, 0.92, 0.985, 1.0)
+MATERIAL_RARITY_CUM_WEIGHTS: Tuple[float, ...] = (45, 75, 93, 99, 100)
+
+# Shop routing per category & rarity
+SHOPS_ALL = ["blacksmith", "general_store", "magic_shop", "alchemist", "rare_goods", "hunters_guild", "dungeon_merchant"]
+
+def shops_for(category: str, rarity: str) -> List[str]:
+    if category == "weapon":
+        return ["blacksmith", "general_store"] if rarity in ("common", "uncommon") else ["blacksmith", "rare_goods"]
+    if category == "armor":
+        return ["general_store", "blacksmith"] if rarity in ("common", "uncommon") else ["blacksmith", "rare_goods"]
+    if category == "accessory":
+        return ["general_store", "magic_shop"] if rarity in ("common", "uncommon") else ["magic_shop", "rare_goods"]
+    if category == "consumable":
+        return ["general_store", "alchemist"] if rarity in ("common", "uncommon") else ["alchemist", "rare_goods"]
+    return ["general_store"]
+
+# Every (category, rarity) routing, frozen so items can share one object safely.
+_SHOPS_LOOKUP: Dict[Tuple[str, str], Tuple[str, ...]] = {
+    (c, r): tuple(shops_for(c, r))
+    for c in ("weapon", "armor", "accessory", "consumable") for r in RARITY_ORDER
+}
+
+# ---- Name pools ----
+PFX_COMMON: Tuple[str, ...] = (
+    "Iron","Steel","Shadow","Storm","Ember","Frost","Moon","Sun","Dragon",
+    "Raven","Phoenix","Crystal","Obsidian","Silver","Golden","Void","Arcane",
+    "Whisper","Glacier","Oak","Sunsteel"
+)
+SUFFIX_FLAVOR: Tuple[str, ...] = (
+    " of Dawn"," of Dusk"," of Whispers"," of the Phoenix"," of the Glacier"," of Storms",
+    " of Shadows"," of Radiance"," of Embers"," of Frost"," of the Dragon"," of the Raven",
+    " of Clarity"," of Might"," of Swiftness"," of Focus"," of the Tide"," of Sparks"
+)
+
+# Weapons: map name cores to weapon_type; use this for generation + validation
+WEAPON_NAME_CORES: Tuple[Tuple[str, str], ...] = (
+    ("Sword", "sword"), ("Blade", "sword"), ("Saber", "sword"), ("Cutlass", "sword"), ("Claymore", "sword"),
+    ("Axe", "axe"), ("Waraxe", "axe"),
+    ("Mace", "mace"), ("Hammer", "mace"), ("Maul", "mace"),
+    ("Dagger", "dagger"), ("Dirk", "dagger"),
+    ("Spear", "spear"),
+    ("Halberd", "polearm"), ("Glaive", "polearm"),
+    ("Lance", "lance"),
+    ("Bow", "bow"), ("Crossbow", "crossbow"),
+    ("Staff", "staff"),
+    ("Scythe", "scythe"),
+)
+TYPE_TO_WEAPON_TOKENS: Dict[str, List[str]] = {
+    "sword": ["sword","blade","saber","cutlass","claymore"],
+    "axe": ["axe","waraxe"],
+    "mace": ["mace","hammer","maul"],
+    "dagger": ["dagger","dirk"],
+    "spear": ["spear"],
+    "lance": ["lance"],
+    "polearm": ["halberd","glaive"],
+    "bow": ["bow"],
+    "crossbow": ["crossbow"],
+    "staff": ["staff"],
+    "scythe": ["scythe"],
+}
+WEAPON_TOKENS_FLAT = sorted({t for lst in TYPE_TO_WEAPON_TOKENS.values() for t in lst})
+
+# Armor (suit-only): name cores; validate with tokens
+ARMOR_CORES: Tuple[str, ...] = (
+    "Armor","Mail","Plate Armor","Scale Armor","Brigandine",
+    "Leather Armor","Chainmail Armor","Dragonscale Armor","Battle Armor","War Armor"
+)
+ARMOR_TOKENS = [t.lower() for t in ["armor","mail","brigandine","dragonscale","war armor","plate armor","scale armor","chainmail"]]
+
+# Accessories: map name cores to accessory_type
+ACCESSORY_NAME_CORES: Tuple[Tuple[str, str], ...] = (
+    ("Ring", "ring"), ("Amulet", "amulet"), ("Charm", "charm"), ("Band", "band"),
+    ("Brooch", "brooch"), ("Talisman", "talisman"), ("Circlet", "circlet"),
+    ("Pendant", "pendant"), ("Bracelet", "bracelet"), ("Anklet", "anklet"), ("Sash", "sash")
+)
+
+# Consumables: base names + effect kind (consumable_type remains "potion" per your template)
+CONSUMABLE_TEMPLATES: Tuple[Tuple[str, str], ...] = (
+    ("Health Potion", "heal"),
+    ("Greater Health Potion", "heal"),
+    ("Mana Potion", "mana_restore"),
+    ("Elixir of Strength", "stat_boost"),
+    ("Elixir of Dexterity", "stat_boost"),
+    ("Elixir of Constitution", "stat_boost"),
+    ("Elixir of Intelligence", "stat_boost"),
+    ("Elixir of Wisdom", "stat_boost"),
+    ("Elixir of Charisma", "stat_boost"),
+    ("Potion of Swiftness", "speed_boost"),
+)
+CONSUMABLE_KEYWORDS = ["potion","elixir","draught","scroll","tonic"]
+BOOST_STATS: Tuple[str, ...] = ("strength","dexterity","constitution","intelligence","wisdom","charisma")
+
+# Materials
+MATERIAL_TYPES: Tuple[str, ...] = ("metal","wood","gem","stone","cloth","herb","essence","bone","leather")
+MATERIAL_CORES: Tuple[str, ...] = (
+    "Ingot","Bar","Ore","Shard","Crystal","Gem","Thread","Fiber","Silk","Heartwood","Wood","Plank",
+    "Pelt","Leather","Feather","Bone","Scale","Powder","Resin","Herb","Blossom","Root","Seed","Essence","Core"
+)
+MATERIAL_TOKENS = [c.lower() for c in MATERIAL_CORES]
+MATERIAL_DESCS: Tuple[str, ...] = (
+    "A bar of smelted stock, sturdy and ubiquitous.",
+    "Highly sought for advanced recipes.",
+    "Flickers with latent energy.",
+    "Seasoned resource prized by artisans.",
+    "Conductive material suited for runework.",
+)
+# Material sources (IDs)
+TERRITORY_POOL: Tuple[str, ...] = ("verdant_lands_mines","forest_logging_camps","tannery","crystal_cavern","ashmire_deep","ember_hollows")
+DUNGEONS: Tuple[str, ...] = ("ember_hollows","ashmire_deep","moonlit_keep","glacier_pass")
+MATERIAL_SHOPS: Tuple[str, ...] = ("blacksmith","general_store","alchemist","rare_goods")
+
+# Crafting materials pool (IDs)
+CRAFT_POOL: Tuple[str, ...] = (
+    "iron_ingot","steel_ingot","leather_strip","oak_wood","obsidian_shard","ember_crystal",
+    "arcane_thread","moonshade_fabric","vitality_herb","frost_core","storm_essence",
+    "sunsteel_ingot","drakescale","pure_water","healing_herb","luminescent_moss",
+    "crystal_shard","runed_stone","ghost_essence","phoenix_feather"
+)
+
+# Effects pool
+SPECIAL_EFFECT_POOL: Tuple[str, ...] = (
+    "bleed_on_hit", "burn_on_hit", "freeze_on_hit", "shock_on_hit",
+    "mana_leech", "life_leech", "backstab_bonus", "parry_window",
+    "elemental_affinity:fire", "elemental_affinity:ice", "elemental_affinity:lightning",
+    "clarity:spell_focus", "frost_aura", "fear_aura", "thorns", "regen_over_time",
+    "dash_cooldown_reduction", "crit_chain", "lightning_chain"
+)
+
+ELEMENTS: Tuple[str, ...] = ("fire","ice","lightning","poison")
+
+# Gold value range (min, max) per category; rarity interpolates towards max,
+# plus a random 0..min bonus.
+GOLD_RANGES: Dict[str, Tuple[int, int]] = {
+    "weapon": (100, 900),
+    "armor": (120, 1800),
+    "accessory": (150, 1800),
+    "consumable": (20, 400),
+    "material": (3, 45),
+}
+
+# Per-rarity tables are tuples indexed by rarity code (position in RARITY_ORDER):
+# items carry the int code and only emit the rarity name into the JSON.
+_RARE = RARITY_IDX["rare"]
+_EPIC = RARITY_IDX["epic"]
+RARITY_MULT_T: Tuple[float, ...] = tuple(RARITY_MULT[r] for r in RARITY_ORDER)
+
+# Roll ranges (inclusive) and fixed values per rarity code
+_LEVEL_RANGES: Tuple[Tuple[int, int], ...] = ((1, 4), (5, 8), (9, 12), (13, 17), (18, 20))
+_CRIT_CHANCE_RANGES: Tuple[Tuple[int, int], ...] = ((3, 4), (5, 7), (8, 10), (10, 12), (12, 15))
+_ELEM_RES_CHOICES: Tuple[Tuple[int, ...], ...] = ((0,), (0, 5), (5, 10, 15), (10, 15, 20), (15, 20, 25))
+_STAT_BONUS_T: Tuple[int, ...] = tuple(int(round(m)) for m in RARITY_MULT_T)
+_CRIT_DMG_T: Tuple[int, ...] = tuple(120 + int(round(10 * m)) for m in RARITY_MULT_T)
+# int(base + k) == int(base) + k for the non-negative bases here
+_BASE_GOLD: Dict[str, Tuple[int, ...]] = {
+    cat: tuple(int(lo + (hi - lo) * i / (len(RARITY_ORDER) - 1)) for i in range(len(RARITY_ORDER)))
+    for cat, (lo, hi) in GOLD_RANGES.items()
+}
+
+# =============================================================================
+# Helpers (pure functions)
+# =============================================================================
+
+_U32_MASK = 0xFFFFFFFF
+
+# random.choice(pool) without its choice -> _randbelow call chain: the bit width
+# is fixed per pool, so each picker is one getrandbits draw (plus the same
+# rejection retries) and a tuple index -- identical draws, identical results.
+def _picker(pool: Tuple[Any, ...], getrandbits: Callable[[int], int]) -> Callable[[], Any]:
+    if not pool:
+        # getrandbits(0) is always 0, so the rejection loop below would never exit
+        raise ValueError("cannot pick from an empty pool (did a name/effect pool get emptied?)")
+    n = len(pool)
+    k = n.bit_length()
+    def pick() -> Any:
+        i = getrandbits(k)
+        while i >= n:
+            i = getrandbits(k)
+        return pool[i]
+    return pick
+
+class RunState:
+    # Everything one iter_category call draws from: a dedicated generator (the
+    # global `random` state is left alone) and its name-uniqueness counts. Every
+    # call builds its own, so concurrent or interleaved runs never disturb each other.
+    # Generator methods and pool pickers are bound once here, per run.
+    def __init__(self, seed: str) -> None:
+        rng = random.Random(seed)
+        getrandbits = rng.getrandbits
+        self.random = rng.random
+        self.getrandbits = getrandbits
+        self.choices = rng.choices
+        self.uniform = rng.uniform
+        self.name_counts: Dict[str, int] = {}
+
+        # Drop-in for random.randint(lo, hi): Lemire's multiply-shift over one 32-bit
+        # word instead of randint's randrange/_randbelow call chain; unbiased via rejection.
+        # Every numeric stat roll lands here, so the word is drawn inline (no helper call).
+        def rand_range(lo: int, hi: int) -> int:
+            span = hi - lo + 1
+            m = getrandbits(32) * span
+            if (m & _U32_MASK) < span:
+                threshold = (_U32_MASK + 1 - span) % span
+                while (m & _U32_MASK) < threshold:
+                    m = getrandbits(32) * span
+            return lo + (m >> 32)
+        self.rand_range = rand_range
+
+        self.pick_prefix = _picker(PFX_COMMON, getrandbits)
+        self.pick_flavor = _picker(SUFFIX_FLAVOR, getrandbits)
+        self.pick_weapon_core = _picker(WEAPON_NAME_CORES, getrandbits)
+        self.pick_armor_core = _picker(ARMOR_CORES, getrandbits)
+        self.pick_accessory_core = _picker(ACCESSORY_NAME_CORES, getrandbits)
+        self.pick_consumable = _picker(CONSUMABLE_TEMPLATES, getrandbits)
+        self.pick_material_type = _picker(MATERIAL_TYPES, getrandbits)
+        self.pick_material_core = _picker(MATERIAL_CORES, getrandbits)
+        self.pick_material_desc = _picker(MATERIAL_DESCS, getrandbits)
+        self.pick_territory = _picker(TERRITORY_POOL, getrandbits)
+        self.pick_dungeon = _picker(DUNGEONS, getrandbits)
+        self.pick_material_shop = _picker(MATERIAL_SHOPS, getrandbits)
+        self.pick_boost_stat = _picker(BOOST_STATS, getrandbits)
+        self.pick_effect = _picker(SPECIAL_EFFECT_POOL, getrandbits)
+
+# ASCII slug table: apostrophes vanish, anything outside [a-z0-9] becomes "_".
+_SLUG_TABLE = str.maketrans({
+    c: (None if c == "'" else "_")
+    for c in map(chr, range(128))
+    if not ("a" <= c <= "z" or "0" <= c <= "9")
+})
+_NON_SLUG_RE = re.compile(r"[^a-z0-9]+")
+_MULTI_US_RE = re.compile(r"_+")
+
+def to_id(name: str) -> str:
+    s = name.strip().lower()
+    if s.isascii():
+        s = s.translate(_SLUG_TABLE)
+    else:
+        s = _NON_SLUG_RE.sub("_", s.replace("'", ""))
+    if "__" in s:  # generated names rarely have separator runs; skip the regex then
+        s = _MULTI_US_RE.sub("_", s)
+    return s.strip("_")
+
+# Name validators: each check is one frozenset.isdisjoint over the whole words of
+# the lowercased name. Multi-word tokens ("plate armor", ...) all end in a
+# single-word token, which covers them.
+def _token_set(tokens: List[str]) -> frozenset[str]:
+    return frozenset(t for t in tokens if " " not in t)
+
+_WEAPON_TOKS = _token_set(WEAPON_TOKENS_FLAT)
+_WTYPE_TOKS: Dict[str, frozenset[str]] = {t: _token_set(toks) for t, toks in TYPE_TO_WEAPON_TOKENS.items()}
+_ARMOR_TOKS = _token_set(ARMOR_TOKENS)
+_CONSUMABLE_TOKS = _token_set(CONSUMABLE_KEYWORDS)
+_MATERIAL_TOKS = _token_set(MATERIAL_TOKENS)
+
+def validate_item(item: Dict[str, Any]) -> None:
+    # Name <-> category/type consistency (assert-based, so a no-op under python -O)
+    name = item["name"]
+    words = name.lower().split()
+    kind = item["type"]
+    if kind == "weapon":
+        assert not _WEAPON_TOKS.isdisjoint(words), f"Weapon name missing core: {name}"
+        wtype_toks = _WTYPE_TOKS.get(item["weapon_type"])
+        assert wtype_toks is not None and not wtype_toks.isdisjoint(words), \
+            f"Weapon name/type mismatch: {name} vs {item['weapon_type']}"
+    elif kind == "armor":
+        assert not _ARMOR_TOKS.isdisjoint(words), f"Armor name not a suit: {name}"
+    elif kind == "accessory":
+        assert item["accessory_type"] in words, f"Accessory name/type mismatch: {name} vs {item['accessory_type']}"
+    elif kind == "consumable":
+        assert not _CONSUMABLE_TOKS.isdisjoint(words), f"Consumable name missing keyword: {name}"
+    elif kind == "crafting_material":
+        assert not _MATERIAL_TOKS.isdisjoint(words), f"Material name lacks material token: {name}"
+
+# Names are "<prefix> <core>[ flavor][ numeral]", so these per-core invariants
+# guarantee every check above; builders rely on them instead of re-checking.
+assert all(core.lower() in _WTYPE_TOKS[wtype] for core, wtype in WEAPON_NAME_CORES), "weapon core/type mismatch"
+assert all(not _ARMOR_TOKS.isdisjoint(c.lower().split()) for c in ARMOR_CORES), "armor core without suit token"
+assert all(core.lower() == atype for core, atype in ACCESSORY_NAME_CORES), "accessory core/type mismatch"
+assert all(not _CONSUMABLE_TOKS.isdisjoint(b.lower().split()) for b, _ in CONSUMABLE_TEMPLATES), "consumable without keyword"
+assert all(c.lower() in _MATERIAL_TOKS for c in MATERIAL_CORES), "material core without token"
+
+def checked_items(items: Iterable[Dict[str, Any]], limit: int | None = None) -> Iterator[Dict[str, Any]]:
+    # Passes items through, running validate_item on the first `limit` (all if None).
+    it = iter(items)
+    for item in islice(it, limit):
+        validate_item(item)
+        yield item
+    yield from it
+
+_ROMAN_DIGITS: Tuple[Tuple[int, str], ...] = (
+    (1000, "M"), (900, "CM"), (500, "D"), (400, "CD"), (100, "C"), (90, "XC"),
+    (50, "L"), (40, "XL"), (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"),
+)
+_ROMAN: Dict[int, str] = {}  # memo: the same few ordinals recur for every repeated name
+
+def roman(n: int) -> str:
+    s = _ROMAN.get(n)
+    if s is None:
+        parts: List[str] = []
+        k = n
+        for value, digits in _ROMAN_DIGITS:
+            q, k = divmod(k, value)
+            parts.append(digits * q)
+        s = _ROMAN[n] = "".join(parts)
+    return s
+
+def unique_name(run: RunState, base: str, allow_suffix: bool = True, allow_flavor: bool = True) -> str:
+    name = base
+    if allow_flavor and allow_suffix and run.random() < 0.5:
+        name += run.pick_flavor()
+    seen = run.name_counts.get(name, 0) + 1
+    run.name_counts[name] = seen
+    if seen == 1:
+        return name
+    # Repeats are numbered by occurrence ("<name> II", "<name> III", ...), so no draws or retries.
+    return f"{name} {roman(seen)}"
+
+_IMG_PREFIX: Dict[str, str] = {
+    cat: f"res://assets/textures/{cat}/"
+    for cat in ("weapons", "armor", "accessories", "consumables", "materials")
+}
+_RECIPE_PREFIX = "rcp_"
+
+def img_path(category: str, _id: str) -> str:
+    return _IMG_PREFIX[category] + _id + ".png"
+
+# Effect strings only depend on (effect, rarity), so they are formatted once here.
+# On-hit procs also carry a random 3..6s duration: they map to every formatted
+# variant, indexed by the rolled duration; other effects map to a 1-tuple.
+_PROC_EFFECTS = ("bleed_on_hit","burn_on_hit","freeze_on_hit","shock_on_hit")
+_PROC_SECONDS = (3, 4, 5, 6)
+
+def _effect_texts(e: str, mult: float) -> Tuple[str, ...]:
+    if e in _PROC_EFFECTS:
+        return tuple(f"{e}:{10 + int(5 * mult)}%:{s}s" for s in _PROC_SECONDS)
+    if e.startswith("elemental_affinity") or e == "clarity:spell_focus":
+        return (f"{e}:{5 + int(5 * mult)}%",)
+    return (e,)
+
+_EFFECT_TEXTS: Tuple[Dict[str, Tuple[str, ...]], ...] = tuple(
+    {e: _effect_texts(e, m) for e in SPECIAL_EFFECT_POOL} for m in RARITY_MULT_T
+)
+
+def maybe_effects(run: RunState, ri: int) -> List[str]:
+    effects: List[str] = []
+    if run.random() < 0.33 or ri >= _RARE:
+        count = 2 if ri >= _EPIC else 1
+        texts = _EFFECT_TEXTS[ri]
+        for _ in range(count):
+            opts = texts[run.pick_effect()]
+            effects.append(opts[0] if len(opts) == 1 else opts[run.rand_range(0, len(opts) - 1)])
+    return effects
+
+# CRAFT_POOL entries are already ids, so recipes use them as-is (no to_id pass).
+assert all(to_id(m) == m for m in CRAFT_POOL), "CRAFT_POOL entries must be valid ids"
+_MATS_PER_RARITY: Tuple[int, ...] = tuple(1 + i // 2 for i in range(len(RARITY_ORDER)))
+
+def craft_mats(run: RunState, ri: int, min_n: int, max_n: int, *, liquid: bool=False) -> Dict[str, int]:
+    picks = run.choices(CRAFT_POOL, k=run.rand_range(min_n, max_n))
+    if liquid:
+        picks = ["pure_water" if m != "pure_water" and run.random() < 0.33 else m for m in picks]
+    # Repeated picks collapse into one entry, keeping first-pick order.
+    return dict.fromkeys(picks, _MATS_PER_RARITY[ri])
+
+# Consumable description per effect kind, indexed by rarity code
+_CONSUMABLE_DESC: Dict[str, Tuple[str, ...]] = {
+    "heal": (
+        "Restores a modest amount of health instantly.",
+        "A potent brew that restores more health.",
+        "A strong restorative for grievous wounds.",
+        "An elite draught favored by champions.",
+        "A mythical concoction that mends any injury.",
+    ),
+    "mana_restore": ("Replenishes a portion of mana instantly.",) * len(RARITY_ORDER),
+    "stat_boost": ("Temporarily enhances attributes.",) * len(RARITY_ORDER),
+    "speed_boost": ("Increases movement speed for a short time.",) * len(RARITY_ORDER),
+}
+
+def consumable_desc(kind: str, ri: int) -> str:
+    return _CONSUMABLE_DESC[kind][ri]
+
+# Zeroed effect skeletons; build_effect shallow-copies and fills in the few
+# rarity-dependent fields instead of rebuilding the nested dicts per potion.
+_EMPTY_STATS: Dict[str, int] = {
+    "health": 0, "mana": 0,
+    "strength": 0, "dexterity": 0, "constitution": 0,
+    "intelligence": 0, "wisdom": 0, "charisma": 0,
+}
+_EFFECT_PROTO: Dict[str, Dict[str, Any]] = {
+    kind: {"type": kind, "value": 0, "duration": 0, "instant": kind in ("heal", "mana_restore")}
+    for kind in dict.fromkeys(k for _, k in CONSUMABLE_TEMPLATES)
+}
+
+# Consumable effect numbers per rarity code
+_HEAL_VALUE: Tuple[int, ...] = (120, 350, 600, 900, 1400)
+_MANA_VALUE: Tuple[int, ...] = (100, 200, 350, 500, 750)
+_BOOST_DURATION: Tuple[int, ...] = (300, 300, 600, 900, 1200)
+_BOOST_AMOUNT: Tuple[int, ...] = (1, 2, 3, 4, 5)
+_SPEED_DURATION: Tuple[int, ...] = (180, 180, 300, 420, 420)
+_SPEED_VALUE: Tuple[int, ...] = (15, 20, 25, 30, 35)
+
+def build_effect(run: RunState, kind: str, ri: int) -> Dict[str, Any]:
+    eff = _EFFECT_PROTO[kind].copy()
+    stats = eff["stats_affected"] = _EMPTY_STATS.copy()
+    if kind == "heal":
+        eff["value"] = stats["health"] = _HEAL_VALUE[ri]
+    elif kind == "mana_restore":
+        eff["value"] = stats["mana"] = _MANA_VALUE[ri]
+    elif kind == "stat_boost":
+        which = run.pick_boost_stat()
+        eff["duration"] = _BOOST_DURATION[ri]
+        stats[which] = _BOOST_AMOUNT[ri]
+    elif kind == "speed_boost":
+        eff["duration"] = _SPEED_DURATION[ri]
+        eff["value"] = _SPEED_VALUE[ri]
+    return eff
+
+# =============================================================================
+# Builders (category-specific)
+# =============================================================================
+
+# Each make_*_builder(ri, run) returns a builder specialized for one rarity code and
+# drawing from one run's state: everything that depends only on the rarity
+# (multiplier, level/crit ranges, gold base, shops) is resolved once here instead of
+# on every item, and the run's draw methods are bound to closure locals.
+
+def scaled_table(lo: int, hi: int, mult: float) -> Tuple[int, ...]:
+    # int(round(base * mult)) for every base roll in [lo, hi], indexed by base - lo
+    return tuple(int(round(b * mult)) for b in range(lo, hi + 1))
+
+# -- Weapons --
+def name_weapon(run: RunState) -> Tuple[str, str]:
+    core, wtype = run.pick_weapon_core()
+    base = f"{run.pick_prefix()} {core}"
+    name = unique_name(run, base, allow_suffix=True, allow_flavor=True)
+    return name, wtype  # wtype derived from core
+
+def make_weapon_builder(ri: int, run: RunState) -> Callable[[], Dict[str, Any]]:
+    rand_range = run.rand_range
+    rand = run.random
+    r = RARITY_ORDER[ri]
+    mult = RARITY_MULT_T[ri]
+    bonus = _STAT_BONUS_T[ri]
+    lvl_lo, lvl_hi = _LEVEL_RANGES[ri]
+    cc_lo, cc_hi = _CRIT_CHANCE_RANGES[ri]
+    crit_dmg = _CRIT_DMG_T[ri]
+    atk_by_roll = scaled_table(10, 20, mult)
+    atk_last = len(atk_by_roll) - 1  # roll bounds follow the table, not the literal range
+    gold_base, gold_jitter = _BASE_GOLD["weapon"][ri], GOLD_RANGES["weapon"][0]
+    img_prefix = _IMG_PREFIX["weapons"]
+    shops = _SHOPS_LOOKUP[("weapon", r)]
+
+    def weapon_item() -> Dict[str, Any]:
+        name, wtype_from_core = name_weapon(run)
+        _id = to_id(name)
+        atk = atk_by_roll[rand_range(0, atk_last)] + rand_range(0, 3)  # base attack 10..20
+        item = {
+            "id": _id, "name": name, "type": "weapon",
+            "weapon_type": wtype_from_core,
+            "rarity": r, "level_requirement": rand_range(lvl_lo, lvl_hi),
+            "stats": {
+                "attack": atk,
+                "strength_bonus": bonus, "dexterity_bonus": bonus,
+                "constitution_bonus": bonus if rand() < 0.5 else 0,
+                "intelligence_bonus": 0, "wisdom_bonus": 0, "charisma_bonus": 0,
+                "critical_chance": rand_range(cc_lo, cc_hi), "critical_damage": crit_dmg,
+            },
+            "special_effects": maybe_effects(run, ri),
+            "value": gold_base + rand_range(0, gold_jitter),
+            "durability": rand_range(70,180),
+            "crafting": {
+                "recipe_id": _RECIPE_PREFIX + _id,
+                "materials": craft_mats(run, ri, 2, 4),
+            },
+            "shop_availability": shops,
+            "image": img_prefix + _id + ".png",
+        }
+        return item
+    return weapon_item
+
+# -- Armor (suit only) --
+def name_armor(run: RunState) -> str:
+    base = f"{run.pick_prefix()} {run.pick_armor_core()}"
+    return unique_name(run, base, allow_suffix=True, allow_flavor=True)
+
+def make_armor_builder(ri: int, run: RunState) -> Callable[[], Dict[str, Any]]:
+    rand_range = run.rand_range
+    getrandbits = run.getrandbits
+    r = RARITY_ORDER[ri]
+    mult = RARITY_MULT_T[ri]
+    bonus = _STAT_BONUS_T[ri]
+    ac_bonus = min(int(mult), 3)
+    def_by_roll = scaled_table(12, 20, mult)  # suits are beefier
+    def_last = len(def_by_roll) - 1
+    # Fixed-value rarities copy a prebuilt resistance dict; the rest roll each element.
+    res_opts = _ELEM_RES_CHOICES[ri]
+    res_proto = dict.fromkeys(ELEMENTS, res_opts[0]) if len(res_opts) == 1 else None
+    pick_res = _picker(res_opts, getrandbits)
+    lvl_lo, lvl_hi = _LEVEL_RANGES[ri]
+    gold_base, gold_jitter = _BASE_GOLD["armor"][ri], GOLD_RANGES["armor"][0]
+    img_prefix = _IMG_PREFIX["armor"]
+    shops = _SHOPS_LOOKUP[("armor", r)]
+
+    def armor_item() -> Dict[str, Any]:
+        name = name_armor(run)
+        _id = to_id(name)
+        defense = def_by_roll[rand_range(0, def_last)] + rand_range(0, 3)
+        res = res_proto.copy() if res_proto is not None else {e: pick_res() for e in ELEMENTS}
+        coins = getrandbits(3)  # one fair coin per optional stat bonus
+        item = {
+            "id": _id, "name": name, "type": "armor",
+            "armor_type": "suit",
+            "rarity": r, "level_requirement": rand_range(lvl_lo, lvl_hi),
+            "stats": {
+                "defense": defense,
+                "armor_class_bonus": ac_bonus,
+                "strength_bonus": bonus if coins & 1 else 0,
+                "dexterity_bonus": bonus if coins & 2 else 0,
+                "constitution_bonus": bonus if coins & 4 else 0,
+                "intelligence_bonus": 0, "wisdom_bonus": 0, "charisma_bonus": 0,
+                "elemental_resistance": res,
+            },
+            "special_effects": maybe_effects(run, ri),
+            "value": gold_base + rand_range(0, gold_jitter),
+            "durability": rand_range(110,190),
+            "crafting": {
+                "recipe_id": _RECIPE_PREFIX + _id,
+                "materials": craft_mats(run, ri, 3, 5),
+            },
+            "shop_availability": shops,
+            "image": img_prefix + _id + ".png",
+        }
+        return item
+    return armor_item
+
+# -- Accessories (name core drives accessory_type) --
+def name_accessory(run: RunState) -> Tuple[str, str]:
+    core, atype = run.pick_accessory_core()
+    base = f"{run.pick_prefix()} {core}"
+    name = unique_name(run, base, allow_suffix=True, allow_flavor=True)
+    return name, atype
+
+def make_accessory_builder(ri: int, run: RunState) -> Callable[[], Dict[str, Any]]:
+    rand_range = run.rand_range
+    getrandbits = run.getrandbits
+    r = RARITY_ORDER[ri]
+    mult = RARITY_MULT_T[ri]
+    bonus = _STAT_BONUS_T[ri]
+    mana_regen = int(round(mult))
+    health_regen = max(int(round(mult)) - 1, 0)
+    exp_bonus = int(5 * mult) if ri >= _RARE else 0
+    lvl_lo, lvl_hi = _LEVEL_RANGES[ri]
+    gold_base, gold_jitter = _BASE_GOLD["accessory"][ri], GOLD_RANGES["accessory"][0]
+    img_prefix = _IMG_PREFIX["accessories"]
+    shops = _SHOPS_LOOKUP[("accessory", r)]
+
+    def accessory_item() -> Dict[str, Any]:
+        name, atype = name_accessory(run)
+        _id = to_id(name)
+        coins = getrandbits(6)  # one fair coin per optional stat bonus
+        item = {
+            "id": _id, "name": name, "type": "accessory",
+            "accessory_type": atype,
+            "rarity": r, "level_requirement": rand_range(lvl_lo, lvl_hi),
+            "stats": {
+                "strength_bonus": bonus if coins & 1 else 0,
+                "dexterity_bonus": bonus if coins & 2 else 0,
+                "constitution_bonus": bonus if coins & 4 else 0,
+                "intelligence_bonus": bonus if coins & 8 else 0,
+                "wisdom_bonus": bonus if coins & 16 else 0,
+                "charisma_bonus": bonus if coins & 32 else 0,
+                "mana_regeneration": mana_regen,
+                "health_regeneration": health_regen,
+                "experience_bonus": exp_bonus,
+            },
+            "special_effects": maybe_effects(run, ri),
+            "value": gold_base + rand_range(0, gold_jitter),
+            "durability": rand_range(40,120),
+            "crafting": {
+                "recipe_id": _RECIPE_PREFIX + _id,
+                "materials": craft_mats(run, ri, 2, 3),
+            },
+            "shop_availability": shops,
+            "image": img_prefix + _id + ".png",
+        }
+        return item
+    return accessory_item
+
+# -- Consumables (exact effect schema; type=potion) --
+def name_consumable(run: RunState) -> Tuple[str, str]:
+    base, kind = run.pick_consumable()
+    name = unique_name(run, base, allow_suffix=False, allow_flavor=False)
+    return name, kind
+
+def make_consumable_builder(ri: int, run: RunState) -> Callable[[], Dict[str, Any]]:
+    rand_range = run.rand_range
+    r = RARITY_ORDER[ri]
+    stack_size = 99 if ri < _RARE else 10
+    gold_base, gold_jitter = _BASE_GOLD["consumable"][ri], GOLD_RANGES["consumable"][0]
+    img_prefix = _IMG_PREFIX["consumables"]
+    shops = _SHOPS_LOOKUP[("consumable", r)]
+    descs = {kind: consumable_desc(kind, ri) for kind in _CONSUMABLE_DESC}
+
+    def consumable_item() -> Dict[str, Any]:
+        name, kind = name_consumable(run)
+        _id = to_id(name)
+        eff = build_effect(run, kind, ri)
+        item = {
+            "id": _id, "name": name, "type": "consumable",
+            "consumable_type": "potion",
+            "rarity": r, "effect": eff,
+            "stack_size": stack_size,
+            "value": gold_base + rand_range(0, gold_jitter),
+            "crafting": {
+                "recipe_id": _RECIPE_PREFIX + _id,
+                "materials": craft_mats(run, ri, 2, 3, liquid=True),
+            },
+            "shop_availability": shops,
+            "description": descs[kind],
+            "image": img_prefix + _id + ".png",
+        }
+        return item
+    return consumable_item
+
+# -- Materials --
+def name_material(run: RunState) -> str:
+    base = f"{run.pick_prefix()} {run.pick_material_core()}"
+    return unique_name(run, base, allow_suffix=False, allow_flavor=False)
+
+def make_material_builder(ri: int, run: RunState) -> Callable[[], Dict[str, Any]]:
+    rand_range = run.rand_range
+    rand = run.random
+    uniform = run.uniform
+    pick_dungeon = run.pick_dungeon
+    pick_material_desc = run.pick_material_desc
+    pick_material_shop = run.pick_material_shop
+    pick_material_type = run.pick_material_type
+    pick_territory = run.pick_territory
+    r = RARITY_ORDER[ri]
+    gold_base, gold_jitter = _BASE_GOLD["material"][ri], GOLD_RANGES["material"][0]
+    img_prefix = _IMG_PREFIX["materials"]
+
+    def material_item() -> Dict[str, Any]:
+        name = name_material(run)
+        _id = to_id(name)
+        mtype = pick_material_type()
+        sources: List[Dict[str, Any]] = [
+            {"type": "territory_income", "source_id": pick_territory(), "rate_per_hour": round(uniform(1.5,4.5),2), "drop_rate": 0.0},
+            {"type": "shop", "source_id": pick_material_shop(), "rate_per_hour": 0.0, "drop_rate": 0.0},
+        ]
+        if rand() < 0.33:
+            sources.append({"type": "dungeon_drop", "source_id": pick_dungeon(), "rate_per_hour": 0.0, "drop_rate": round(uniform(5.0,18.0),2)})
+        item = {
+            "id": _id, "name": name, "type": "crafting_material",
+            "material_type": mtype,
+            "rarity": r, "stack_size": 999, "value": gold_base + rand_range(0, gold_jitter),
+            "sources": sources,
+            "description": pick_material_desc(),
+            "image": img_prefix + _id + ".png",
+        }
+        return item
+    return material_item
+
+# =============================================================================
+# Orchestration
+# =============================================================================
+
+# category -> builder factory; iter_category makes one builder per rarity for each run
+BUILDERS: Dict[str, Callable[[int, RunState], Callable[[], Dict[str, Any]]]] = {
+    "weapons": make_weapon_builder,
+    "armor": make_armor_builder,
+    "accessories": make_accessory_builder,
+    "consumables": make_consumable_builder,
+    "materials": make_material_builder,
+}
+CATEGORY_RARITY_CUM_WEIGHTS: Dict[str, Tuple[float, ...]] = {
+    "materials": MATERIAL_RARITY_CUM_WEIGHTS,
+}
+
+CATEGORIES: Tuple[str, ...] = tuple(BUILDERS)
+CATALOG_VERSION = "1.0"
+
+def iter_category(category: str, n: int, seed: int) -> Iterator[Dict[str, Any]]:
+    # Each call owns its RNG stream and name scope (a fresh RunState), so the result
+    # is the same whether categories run sequentially, interleaved, from several
+    # threads or in separate worker processes.
+    run = RunState(f"{seed}:{category}")
+    make = BUILDERS[category]
+    builders = tuple(make(ri, run) for ri in range(len(RARITY_ORDER)))
+    # One batched rarity draw per category instead of one RNG call per item.
+    cum = CATEGORY_RARITY_CUM_WEIGHTS.get(category, RARITY_CUM_WEIGHTS)
+    for i in run.choices(range(len(RARITY_ORDER)), cum_weights=cum, k=n):
+        yield builders[i]()
+
+def build_category(category: str, n: int, seed: int) -> List[Dict[str, Any]]:
+    return list(iter_category(category, n, seed))
+
+@dataclass
+class GenConfig:
+    per_category: int = DEFAULT_PER_CATEGORY
+    out_path: str = DEFAULT_OUTPUT_PATH
+    seed: int = RNG_SEED
+    validate: bool = field(default_factory=lambda: VALIDATE)  # read at construction, so runtime VALIDATE = True applies
+    jobs: int = 1  # worker processes; >1 builds categories in parallel
+
+def iter_categories(cfg: GenConfig) -> Iterator[Tuple[str, Iterable[Dict[str, Any]]]]:
+    # Yields (category, items) in catalog order. Sequential runs yield lazy item
+    # iterators; with jobs > 1 each category is built up front in a worker process.
+    # Either way each category draws from its own RunState, so the iterators may be
+    # consumed in any order, even interleaved, with the same result. Items are
+    # validated here, in the parent: all of them with cfg.validate, else a sample.
+    n = cfg.per_category
+    limit = None if cfg.validate else VALIDATE_SAMPLE
+    if cfg.jobs > 1:
+        # Process pool: the work is pure-Python CPU, so threads would serialize on the GIL.
+        with ProcessPoolExecutor(max_workers=min(cfg.jobs, len(CATEGORIES))) as ex:
+            built = ex.map(build_category, CATEGORIES,
+                           [n] * len(CATEGORIES), [cfg.seed] * len(CATEGORIES))
+            for c, items in zip(CATEGORIES, built):
+                yield c, checked_items(items, limit)
+    else:
+        for c in CATEGORIES:
+            yield c, checked_items(iter_category(c, n, cfg.seed), limit)
+
+def generate(cfg: GenConfig) -> Dict[str, Any]:
+    categories: Dict[str, Any] = {c: list(items) for c, items in iter_categories(cfg)}
+    categories["rarity_multipliers"] = RARITY_MULT
+    categories["rarity_colors"] = RARITY_COLORS
+    data = {
+        "version": CATALOG_VERSION,
+        "categories": categories,
+    }
+    return data
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        # orjson always emits UTF-8 and its only indent width is 2, matching the stdlib output.
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+def _dumps_nested(obj: Any, level: int) -> bytes:
+    # Pretty JSON for a value nested `level` deep; encoded strings never contain raw newlines.
+    return _dumps(obj).replace(b"\n", b"\n" + b"  " * level)
+
+def _ensure_parent_dir(path: str) -> str:
+    # Creates the directory `path` goes into (none for a bare filename) and returns it.
+    out_dir = os.path.dirname(path)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    return out_dir
+
+def write_json(path: str, obj: Dict[str, Any]) -> None:
+    _ensure_parent_dir(path)
+    with open(path, "wb") as f:
+        f.write(_dumps(obj))
+        f.write(b"\n")
+
+def write_catalog(cfg: GenConfig) -> None:
+    # Streams the catalog item by item in exactly the layout write_json(generate(cfg))
+    # produces, so a sequential run never holds more than one item in memory.
+    # Items are generated while writing, so the stream goes to a temp file beside the
+    # target that replaces it only once complete: a failure mid-run (builder error,
+    # --validate assert, worker crash) leaves the previous catalog untouched.
+    out_dir = _ensure_parent_dir(cfg.out_path)
+    tmp = tempfile.NamedTemporaryFile(dir=out_dir or ".", prefix=os.path.basename(cfg.out_path) + ".",
+                                      suffix=".tmp", delete=False)
+    try:
+        with tmp as f:
+            f.write(b'{\n  "version": ' + _dumps(CATALOG_VERSION) + b',\n  "categories": {')
+            sep = b"\n    "
+            for category, items in iter_categories(cfg):
+                f.write(sep + _dumps(category) + b": [")
+                lead = first = b"\n      "
+                for item in items:
+                    f.write(lead)
+                    f.write(_dumps_nested(item, 3))
+                    lead = b",\n      "
+                f.write(b"]" if lead is first else b"\n    ]")
+                sep = b",\n    "
+            for key, table in (("rarity_multipliers", RARITY_MULT), ("rarity_colors", RARITY_COLORS)):
+                f.write(sep + _dumps(key) + b": " + _dumps_nested(table, 2))
+            f.write(b"\n  }\n}\n")
+        # NamedTemporaryFile creates 0600 files; give the catalog the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp.name, 0o666 & ~umask)
+        os.replace(tmp.name, cfg.out_path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def parse_args() -> GenConfig:
+    ap = argparse.ArgumentParser(description="Generate a Godot-ready item catalog JSON.")
+    ap.add_argument("--out", dest="out_path", default=DEFAULT_OUTPUT_PATH, help="Output JSON path")
+    ap.add_argument("--count", dest="count", type=int, default=DEFAULT_PER_CATEGORY, help="Items per category")
+    ap.add_argument("--seed", dest="seed", type=int, default=RNG_SEED, help="Random seed")
+    ap.add_argument("--validate", dest="validate", action="store_true", default=VALIDATE,
+                    help="Check every item's name against its category/type tokens")
+    ap.add_argument("--jobs", dest="jobs", type=int, default=1,
+                    help="Worker processes for building categories in parallel (max 5; worth it for large --count)")
+    args = ap.parse_args()
+    return GenConfig(per_category=args.count, out_path=args.out_path, seed=args.seed,
+                     validate=args.validate, jobs=args.jobs)
+
+def main() -> None:
+    cfg = parse_args()
+    write_catalog(cfg)
+    total = cfg.per_category * 5
+    print(f"✅ Wrote {cfg.out_path} with {total} items (armor = full suits).")
+
+if __name__ == "__main__":
+    main()